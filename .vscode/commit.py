@@ -96,9 +96,8 @@ def check_and_set_git_credentials():
         subprocess.run(["git", "config", "--global", "user.name", DEFAULT_GIT_NAME])
 
 def add_new_files():
-    result = subprocess.run(["git", "status", "--porcelain"], capture_output=True, text=True)
-    lines = result.stdout.strip().split("\n")
-    new_files = [line[3:] for line in lines if line.startswith("?? ")]
+    result = subprocess.run(["git", "ls-files", "--others", "--exclude-standard", "-z"], capture_output=True, text=True)
+    new_files = [f for f in result.stdout.split("\0") if f]
     if new_files:
         subprocess.run(["git", "add"] + new_files)
 